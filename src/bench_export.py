@@ -0,0 +1,75 @@
+import io
+import time
+from datetime import datetime
+from pathlib import Path
+
+from export.ndjson import write_routes_ndjson
+from providers.openflights import OpenFlightsProvider
+from search.engine import find_flight_routes
+
+# Each route is serialised this many times per measurement
+COPIES = 2000
+
+# Best-of-N timing to reduce noise from the first (cold) run
+REPEATS = 5
+
+
+def best_of(fn) -> float:
+    fn()  # warm-up
+
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main() -> None:
+    data_dir = Path("./data")
+    provider = OpenFlightsProvider(data_dir)
+
+    departure_time = datetime(2026, 3, 1, 8, 0)
+
+    airport_pairs = [
+        ("SYD", "MEL"),
+        ("LHR", "JFK"),
+        ("YYC", "SYD"),
+    ]
+
+    routes = []
+    for origin, destination in airport_pairs:
+        routes += find_flight_routes(
+            origin=origin,
+            destination=destination,
+            provider=provider,
+            departure_time=departure_time,
+            max_legs=3,
+            max_routes=10,
+        )
+
+    workload = routes * COPIES
+    print(f"Routes per measurement: {len(workload)}")
+
+    def run_to_string() -> None:
+        for route in workload:
+            route.to_string()
+
+    def run_ndjson() -> None:
+        write_routes_ndjson(workload, io.BytesIO())
+
+    def run_ndjson_metadata() -> None:
+        write_routes_ndjson(workload, io.BytesIO(), include_metadata=True)
+
+    for label, fn in [
+        ("to_string", run_to_string),
+        ("ndjson", run_ndjson),
+        ("ndjson + metadata", run_ndjson_metadata),
+    ]:
+        seconds = best_of(fn)
+        print(f"{label:<20} {len(workload) / seconds:>12,.0f} routes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import time
+from datetime import datetime
+from pathlib import Path
+
+from providers.openflights import OpenFlightsProvider
+from search.engine import find_flight_routes, find_multi_airport_routes
+
+# Same cutoff for both strategies: every route up to MAX_LEGS
+MAX_LEGS = 2
+NO_LIMIT = 10**9
+
+
+def main() -> None:
+    data_dir = Path("./data")
+    provider = OpenFlightsProvider(data_dir)
+
+    departure_time = datetime(2026, 3, 1, 8, 0)
+
+    origins = provider.metro_airports("LON")
+    destinations = provider.metro_airports("NYC")
+
+    print(f"Origins: {origins}")
+    print(f"Destinations: {destinations}")
+
+    start = time.perf_counter()
+    pairwise = []
+    for origin in origins:
+        for destination in destinations:
+            pairwise += find_flight_routes(
+                origin=origin,
+                destination=destination,
+                provider=provider,
+                departure_time=departure_time,
+                max_legs=MAX_LEGS,
+                max_routes=NO_LIMIT,
+            )
+    pairwise_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    merged = find_multi_airport_routes(
+        origins=origins,
+        destinations=destinations,
+        provider=provider,
+        departure_time=departure_time,
+        max_legs=MAX_LEGS,
+        max_routes=NO_LIMIT,
+    )
+    merged_seconds = time.perf_counter() - start
+
+    print(
+        f"{len(origins) * len(destinations)} pairwise searches: "
+        f"{pairwise_seconds:.2f}s, {len(pairwise)} routes"
+    )
+    print(f"1 multi-airport search: {merged_seconds:.2f}s, {len(merged)} routes")
+
+
+if __name__ == "__main__":
+    main()
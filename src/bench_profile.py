@@ -0,0 +1,81 @@
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from providers.openflights import OpenFlightsProvider
+from search.engine import find_flight_routes
+from search.profile import find_profile_routes
+
+ORIGIN = "SYD"
+DESTINATION = "JFK"
+
+WINDOW_DAYS = 7
+MAX_LEGS = 3
+NO_LIMIT = 10**9
+
+
+def pareto(routes):
+    """
+    Keep routes not beaten by one departing no earlier and arriving no later.
+    """
+    front = []
+    best_arrival = None
+
+    for route in sorted(routes, key=lambda r: (-r.departure_time.timestamp(), r.arrival_time)):
+        if best_arrival is None or route.arrival_time < best_arrival:
+            front.append(route)
+            best_arrival = route.arrival_time
+
+    front.reverse()
+    return front
+
+
+def main() -> None:
+    data_dir = Path("./data")
+    provider = OpenFlightsProvider(data_dir)
+
+    window_start = datetime(2026, 3, 1, 0, 0)
+    window_end = window_start + timedelta(days=WINDOW_DAYS)
+
+    # Naive fare-calendar loop: one full search per hour
+    start = time.perf_counter()
+    hourly = []
+    search_time = window_start
+    while search_time <= window_end:
+        routes = find_flight_routes(
+            origin=ORIGIN,
+            destination=DESTINATION,
+            provider=provider,
+            departure_time=search_time,
+            max_legs=MAX_LEGS,
+            max_routes=NO_LIMIT,
+        )
+        if routes:
+            hourly.append(min(routes, key=lambda r: r.arrival_time))
+        search_time += timedelta(hours=1)
+    naive = pareto(hourly)
+    naive_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    profile = find_profile_routes(
+        origin=ORIGIN,
+        destination=DESTINATION,
+        provider=provider,
+        window_start=window_start,
+        window_end=window_end,
+        max_legs=MAX_LEGS,
+    )
+    profile_seconds = time.perf_counter() - start
+
+    print(f"{ORIGIN} -> {DESTINATION}, {WINDOW_DAYS}-day window, max_legs={MAX_LEGS}")
+    print(f"Hourly loop:    {naive_seconds:.2f}s, {len(naive)} Pareto routes")
+    print(f"Profile search: {profile_seconds:.2f}s, {len(profile)} Pareto routes")
+
+    same = [(r.departure_time, r.arrival_time) for r in naive] == [
+        (r.departure_time, r.arrival_time) for r in profile
+    ]
+    print(f"Same departure/arrival profile: {same}")
+
+
+if __name__ == "__main__":
+    main()
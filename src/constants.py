@@ -34,3 +34,29 @@ BASE_FARE_PER_LEG = 50.0
 PRICE_PER_KM = 0.12
 LAYOVER_PENALTY_PER_HOUR = 15.0
 DEFAULT_CURRENCY = "USD"
+
+# ---------------------------------------------------------------------------
+# Metro Areas
+# ---------------------------------------------------------------------------
+
+# IATA metropolitan codes, merged with groups derived from the airport
+# `city` field (which misses e.g. EWR, filed under "Newark")
+METRO_GROUPS = {
+    "NYC": ("JFK", "EWR", "LGA"),
+    "LON": ("LHR", "LGW", "STN", "LTN", "LCY", "SEN"),
+    "PAR": ("CDG", "ORY", "BVA"),
+    "TYO": ("HND", "NRT"),
+    "CHI": ("ORD", "MDW"),
+    "WAS": ("IAD", "DCA", "BWI"),
+    "MIL": ("MXP", "LIN", "BGY"),
+    "STO": ("ARN", "BMA", "NYO"),
+    "MOW": ("SVO", "DME", "VKO"),
+    "SEL": ("ICN", "GMP"),
+    "OSA": ("KIX", "ITM", "UKB"),
+    "BUE": ("EZE", "AEP"),
+    "SAO": ("GRU", "CGH", "VCP"),
+    "RIO": ("GIG", "SDU"),
+    "YTO": ("YYZ", "YTZ"),
+    "BJS": ("PEK", "NAY"),
+    "ROM": ("FCO", "CIA"),
+}
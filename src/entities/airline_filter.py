@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import FrozenSet, Optional
+
+import msgspec
+
+
+class AirlineFilter(msgspec.Struct, frozen=True):
+    """
+    Carrier restriction applied by the provider when generating flights.
+
+    - include: only these airline codes (None = all carriers)
+    - alliances: alliance names, resolved by the provider and added to include
+    - exclude: airline codes never returned (applied last)
+    - codeshares: whether marketing-only (codeshare) routes are returned
+    """
+
+    include: Optional[FrozenSet[str]] = None
+    alliances: FrozenSet[str] = frozenset()
+    exclude: FrozenSet[str] = frozenset()
+    codeshares: bool = True
+
+    def __post_init__(self) -> None:
+        # msgspec does not coerce on construction; accept any iterable of
+        # codes (e.g. a plain set) and freeze it so the filter is hashable
+        for field in ("include", "alliances", "exclude"):
+            value = getattr(self, field)
+            if isinstance(value, frozenset) or (field == "include" and value is None):
+                continue
+            if isinstance(value, str):
+                raise TypeError(
+                    f"AirlineFilter.{field} must be a collection of codes, "
+                    f"not a string ({value!r})"
+                )
+            msgspec.structs.force_setattr(self, field, frozenset(value))
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Tuple, Optional
 
 import msgspec
@@ -69,6 +69,7 @@ class FlightRoute(msgspec.Struct, frozen=True):
     ) -> str:
 
         lines = []
+        layovers = self.layovers
 
         header = (
             f"{self.origin} -> {self.destination} "
@@ -99,15 +100,15 @@ class FlightRoute(msgspec.Struct, frozen=True):
                 [
                     f"Leg {i + 1}: {origin_display} -> {destination_display}",
                     f"Airline: {airline_display}",
-                    f"Dep: {flight.departure_time.strftime('%-I:%M %p, %d-%m-%Y (%Z)')}",
-                    f"Arr: {flight.arrival_time.strftime('%-I:%M %p, %d-%m-%Y (%Z)')}",
+                    f"Dep: {self._format_dt(flight.departure_time)}",
+                    f"Arr: {self._format_dt(flight.arrival_time)}",
                 ]
             )
 
             lines.append("\t" + leg_line)
 
-            if i < len(self.layovers):
-                layover = self.layovers[i]
+            if i < len(layovers):
+                layover = layovers[i]
                 lines.append(f"\n\tLayover: {self._format_td(layover)}\n")
 
         if self.price:
@@ -118,6 +119,17 @@ class FlightRoute(msgspec.Struct, frozen=True):
     def __str__(self) -> str:
         return self.to_string()
 
+    @staticmethod
+    def _format_dt(dt: datetime) -> str:
+        # Same output as strftime("%-I:%M %p, %d-%m-%Y (%Z)"), without
+        # parsing the format string on every call
+        hour = dt.hour % 12 or 12
+        meridiem = "AM" if dt.hour < 12 else "PM"
+        return (
+            f"{hour}:{dt.minute:02d} {meridiem}, "
+            f"{dt.day:02d}-{dt.month:02d}-{dt.year} ({dt.tzname() or ''})"
+        )
+
     @staticmethod
     def _format_td(td: timedelta) -> str:
         total_minutes = int(td.total_seconds() // 60)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from typing import BinaryIO, Iterable, Optional, Tuple
+
+import msgspec
+
+from entities.flight import Flight
+from entities.flight_route import FlightRoute
+from entities.price import Price
+
+
+# ---------------------------------------------------------------------------
+# Compact Wire Schema
+# ---------------------------------------------------------------------------
+
+
+class FlightRecord(msgspec.Struct, frozen=True, omit_defaults=True):
+    """
+    Compact, machine-readable form of a Flight.
+
+    Times are UTC epoch seconds. Resolved names are only present
+    when the encoder is asked to include metadata.
+    """
+
+    origin: str
+    destination: str
+    airline: str
+    departure: int
+    arrival: int
+
+    # Optional metadata
+    airline_name: Optional[str] = None
+    origin_name: Optional[str] = None
+    origin_city: Optional[str] = None
+    origin_country: Optional[str] = None
+    destination_name: Optional[str] = None
+    destination_city: Optional[str] = None
+    destination_country: Optional[str] = None
+
+
+class RouteRecord(msgspec.Struct, frozen=True, omit_defaults=True):
+    origin: str
+    destination: str
+    departure: int
+    arrival: int
+    duration: int
+    flights: Tuple[FlightRecord, ...]
+    price: Optional[Price] = None
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+
+def flight_to_record(flight: Flight, include_metadata: bool = False) -> FlightRecord:
+    departure = int(flight.departure_time.timestamp())
+    arrival = int(flight.arrival_time.timestamp())
+
+    if not include_metadata:
+        return FlightRecord(
+            origin=flight.origin,
+            destination=flight.destination,
+            airline=flight.airline_code,
+            departure=departure,
+            arrival=arrival,
+        )
+
+    return FlightRecord(
+        origin=flight.origin,
+        destination=flight.destination,
+        airline=flight.airline_code,
+        departure=departure,
+        arrival=arrival,
+        airline_name=flight.airline_name,
+        origin_name=flight.origin_name,
+        origin_city=flight.origin_city,
+        origin_country=flight.origin_country,
+        destination_name=flight.destination_name,
+        destination_city=flight.destination_city,
+        destination_country=flight.destination_country,
+    )
+
+
+def route_to_record(route: FlightRoute, include_metadata: bool = False) -> RouteRecord:
+    flights = tuple(flight_to_record(f, include_metadata) for f in route.flights)
+
+    departure = flights[0].departure
+    arrival = flights[-1].arrival
+
+    return RouteRecord(
+        origin=flights[0].origin,
+        destination=flights[-1].destination,
+        departure=departure,
+        arrival=arrival,
+        duration=arrival - departure,
+        flights=flights,
+        price=route.price,
+    )
+
+
+class RouteEncoder:
+    """
+    Reusable msgspec encoder for FlightRoute objects.
+
+    Holds a single output buffer that is reused between calls,
+    so encoding a stream of routes does not allocate per line.
+    """
+
+    def __init__(self, include_metadata: bool = False) -> None:
+        self.include_metadata = include_metadata
+        self._encoder = msgspec.json.Encoder()
+        self._buffer = bytearray(512)
+
+    def encode(self, route: FlightRoute) -> bytes:
+        return self._encoder.encode(route_to_record(route, self.include_metadata))
+
+    def encode_line(self, route: FlightRoute) -> bytes:
+        """
+        Encode a route as a single newline-terminated NDJSON line.
+        """
+        return bytes(self._encode_line(route))
+
+    def _encode_line(self, route: FlightRoute) -> bytearray:
+        # Returns the shared buffer; it is overwritten by the next call.
+        self._encoder.encode_into(
+            route_to_record(route, self.include_metadata),
+            self._buffer,
+        )
+        self._buffer.extend(b"\n")
+        return self._buffer
+
+
+_route_decoder = msgspec.json.Decoder(RouteRecord)
+
+
+def decode_route_record(line: bytes) -> RouteRecord:
+    return _route_decoder.decode(line)
+
+
+# ---------------------------------------------------------------------------
+# Streaming Writer
+# ---------------------------------------------------------------------------
+
+
+def write_routes_ndjson(
+    routes: Iterable[FlightRoute],
+    stream: BinaryIO,
+    *,
+    include_metadata: bool = False,
+    flush: bool = False,
+) -> int:
+    """
+    Write routes to `stream` as NDJSON, one route per line.
+
+    Routes are consumed lazily, so passing `iter_flight_routes(...)`
+    writes each result as soon as the search produces it. Enable
+    `flush` only when a downstream reader must see every line
+    immediately; it costs one flush call per route.
+
+    Returns the number of routes written.
+    """
+
+    encoder = RouteEncoder(include_metadata=include_metadata)
+    written = 0
+
+    for route in routes:
+        stream.write(encoder._encode_line(route))
+        if flush:
+            stream.flush()
+        written += 1
+
+    return written
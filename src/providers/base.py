@@ -2,8 +2,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List
+from typing import Hashable, List, Optional
 
+from entities.airline_filter import AirlineFilter
 from entities.flight import Flight
 from entities.flight_route import FlightRoute
 from entities.price import Price
@@ -25,13 +26,31 @@ class FlightDataProvider(ABC):
         *,
         origin: str,
         departure_time: datetime,
+        airline_filter: Optional[AirlineFilter] = None,
     ) -> List[Flight]:
         """
         Return all flights departing from `origin`
-        at or after `departure_time`.
+        at or after `departure_time`, restricted to the carriers
+        allowed by `airline_filter` when one is given.
         """
         raise NotImplementedError
 
+    def outbound_cache_key(self, *, origin: str, departure_time: datetime) -> Hashable:
+        """
+        Key under which a search may share `get_outbound_flights`
+        results for `origin`: request times with equal keys must
+        return the same flights. The default shares nothing.
+        """
+        return departure_time
+
     @abstractmethod
     def price_route(self, route: FlightRoute) -> Price:
         raise NotImplementedError
+
+    def nearby_airports(self, airport: str, radius_km: float) -> List[str]:
+        """
+        Return `airport` plus any alternatives within `radius_km`,
+        nearest first. Providers without geographic data return
+        only `airport`.
+        """
+        return [airport]
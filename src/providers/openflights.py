@@ -4,10 +4,13 @@ import csv
 import math
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, FrozenSet, Hashable, List, Optional, Tuple
 
 import msgspec
+import numpy as np
+from scipy.spatial import cKDTree
 
+from entities.airline_filter import AirlineFilter
 from entities.flight import Flight
 from entities.flight_route import FlightRoute
 from entities.price import Price
@@ -21,6 +24,7 @@ from constants import (
     PRICE_PER_KM,
     LAYOVER_PENALTY_PER_HOUR,
     DEFAULT_CURRENCY,
+    METRO_GROUPS,
 )
 
 
@@ -29,6 +33,11 @@ class _RouteTemplate(msgspec.Struct, frozen=True):
     destination: str
     airline_code: str
     equipment: tuple[str, ...]
+    codeshare: bool = False
+
+
+# Resolved AirlineFilter: (allowed carriers or None, excluded carriers, codeshares)
+_ResolvedFilter = Tuple[Optional[FrozenSet[str]], FrozenSet[str], bool]
 
 
 class OpenFlightsProvider(FlightDataProvider):
@@ -40,9 +49,23 @@ class OpenFlightsProvider(FlightDataProvider):
         self.airlines: Dict[str, str] = {}
         self.adjacency: Dict[str, List[_RouteTemplate]] = {}
 
+        # Per-airline sub-adjacency: origin -> airline code -> templates
+        self.airline_adjacency: Dict[str, Dict[str, List[_RouteTemplate]]] = {}
+
+        # Alliance name -> member airline codes (optional alliances.json)
+        self.alliances: Dict[str, FrozenSet[str]] = {}
+        self._resolved_filters: Dict[AirlineFilter, _ResolvedFilter] = {}
+
+        # Metro grouping, restricted to airports with outbound routes
+        self.city_airports: Dict[str, List[str]] = {}  # casefolded city -> IATA
+        self.metro_groups: Dict[str, List[str]] = {}  # metro code -> IATA
+
         self._load_airports()
         self._load_airlines()
         self._load_routes()
+        self._load_alliances()
+        self._index_metros()
+        self._index_locations()
 
     # ---------------------------------------------------------------------
     # Data Loading
@@ -102,9 +125,57 @@ class OpenFlightsProvider(FlightDataProvider):
                     destination=destination,
                     airline_code=airline_code,
                     equipment=tuple(row[8].split()) if row[8] != "\\N" else (),
+                    codeshare=row[6] == "Y",
                 )
 
                 self.adjacency.setdefault(origin, []).append(template)
+                self.airline_adjacency.setdefault(origin, {}).setdefault(
+                    airline_code, []
+                ).append(template)
+
+    def _load_alliances(self) -> None:
+        path = self.data_dir / "alliances.json"
+        if not path.exists():
+            return
+
+        raw = msgspec.json.decode(path.read_bytes(), type=Dict[str, List[str]])
+        self.alliances = {name: frozenset(codes) for name, codes in raw.items()}
+
+    def _index_metros(self) -> None:
+        for iata, meta in self.airports.items():
+            if iata in self.adjacency:
+                self.city_airports.setdefault(meta["city"].casefold(), []).append(iata)
+
+        for metro, codes in METRO_GROUPS.items():
+            served = [code for code in codes if code in self.adjacency]
+            if served:
+                self.metro_groups[metro] = served
+
+    def _index_locations(self) -> None:
+        # KD-tree over airport positions as 3D unit vectors; straight-line
+        # (chord) distance is monotonic in great-circle distance
+        self._location_codes: List[str] = list(self.airports)
+        self._location_served = np.array(
+            [code in self.adjacency for code in self._location_codes],
+            dtype=bool,
+        )
+
+        latitudes = np.radians(
+            [self.airports[code]["latitude"] for code in self._location_codes]
+        )
+        longitudes = np.radians(
+            [self.airports[code]["longitude"] for code in self._location_codes]
+        )
+
+        self._location_tree = cKDTree(
+            np.column_stack(
+                (
+                    np.cos(latitudes) * np.cos(longitudes),
+                    np.cos(latitudes) * np.sin(longitudes),
+                    np.sin(latitudes),
+                )
+            )
+        )
 
     # ---------------------------------------------------------------------
     # Public Interface
@@ -115,13 +186,200 @@ class OpenFlightsProvider(FlightDataProvider):
         *,
         origin: str,
         departure_time: datetime,
+        airline_filter: Optional[AirlineFilter] = None,
     ) -> List[Flight]:
 
-        templates = self.adjacency.get(origin, [])
+        if origin not in self.adjacency:
+            return []
+
+        resolved = (
+            self.resolve_airline_filter(airline_filter)
+            if airline_filter is not None
+            else None
+        )
+
+        departure_local = self._next_departure_at_nine(
+            departure_time,
+            self.airports[origin]["timezone"],
+        )
+
         return [
-            self._instantiate_flight(template, departure_time) for template in templates
+            self._instantiate_flight(template, departure_local)
+            for template in self._select_templates(origin, resolved)
         ]
 
+    def outbound_cache_key(self, *, origin: str, departure_time: datetime) -> Hashable:
+        # Every request time before the next 09:00 local gets the same flights
+        meta = self.airports.get(origin)
+        if meta is None:
+            return departure_time
+
+        return self._next_departure_at_nine(departure_time, meta["timezone"])
+
+    def resolve_airline_filter(self, airline_filter: AirlineFilter) -> _ResolvedFilter:
+        """
+        Expand alliances into carrier codes.
+
+        Raises ValueError for alliances missing from alliances.json.
+        """
+
+        resolved = self._resolved_filters.get(airline_filter)
+        if resolved is not None:
+            return resolved
+
+        allowed = airline_filter.include
+        if airline_filter.alliances:
+            unknown = airline_filter.alliances - self.alliances.keys()
+            if unknown:
+                raise ValueError(
+                    f"Unknown alliance(s) {sorted(unknown)}; "
+                    f"known: {sorted(self.alliances)}"
+                )
+
+            members = frozenset().union(
+                *(self.alliances[name] for name in airline_filter.alliances)
+            )
+            allowed = members if allowed is None else allowed | members
+
+        if allowed is not None:
+            allowed = allowed - airline_filter.exclude
+
+        resolved = (allowed, airline_filter.exclude, airline_filter.codeshares)
+        self._resolved_filters[airline_filter] = resolved
+        return resolved
+
+    def airports_in_city(
+        self,
+        city: str,
+        country: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Return all served airports whose OpenFlights `city` matches
+        `city` (case-insensitive), optionally restricted to `country`.
+
+        Raises ValueError if `country` is omitted and the city name
+        exists in more than one country (e.g. London, UK / Canada).
+        """
+
+        codes = self.city_airports.get(city.casefold(), [])
+
+        if country is None:
+            countries = {self.airports[code]["country"] for code in codes}
+            if len(countries) > 1:
+                raise ValueError(
+                    f"City {city!r} is ambiguous; pass one of country="
+                    f"{sorted(countries)}"
+                )
+            return list(codes)
+
+        return [code for code in codes if self.airports[code]["country"] == country]
+
+    def metro_airports(self, code: str) -> List[str]:
+        """
+        Resolve `code` to the served airports of its metro area.
+
+        `code` may be a metro code from constants.METRO_GROUPS (NYC)
+        or an airport IATA code (LHR), in which case the airports
+        sharing its city and country are merged with any metro group
+        containing it.
+        """
+
+        if code in self.metro_groups:
+            return list(self.metro_groups[code])
+
+        meta = self.airports.get(code)
+        if meta is None:
+            return []
+
+        airports = dict.fromkeys(self.airports_in_city(meta["city"], meta["country"]))
+        for members in self.metro_groups.values():
+            if code in members:
+                airports.update(dict.fromkeys(members))
+
+        airports.setdefault(code)
+        return list(airports)
+
+    def airports_within(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        *,
+        served_only: bool = False,
+    ) -> List[Tuple[str, float]]:
+        """
+        Return (IATA, great-circle km) for airports within `radius_km`
+        of a point, nearest first.
+        """
+
+        # Great-circle radius -> chord length on the unit sphere
+        angle = min(radius_km / EARTH_RADIUS_KM, math.pi)
+        chord = 2 * math.sin(angle / 2)
+
+        indices = self._location_tree.query_ball_point(
+            self._unit_vector(latitude, longitude),
+            r=chord,
+        )
+
+        if served_only:
+            indices = [i for i in indices if self._location_served[i]]
+
+        return self._with_distances(latitude, longitude, indices)
+
+    def nearest_airports(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int,
+        *,
+        served_only: bool = False,
+    ) -> List[Tuple[str, float]]:
+        """
+        Return (IATA, great-circle km) for the `k` airports nearest
+        to a point, nearest first.
+        """
+
+        if k <= 0:
+            return []
+
+        total = len(self._location_codes)
+        candidates = min(k, total)
+
+        while True:
+            _, indices = self._location_tree.query(
+                self._unit_vector(latitude, longitude),
+                k=candidates,
+            )
+            indices = list(np.atleast_1d(indices))
+
+            if served_only:
+                indices = [i for i in indices if self._location_served[i]]
+
+            # Unserved airports crowded out some results; widen and retry
+            if len(indices) >= k or candidates == total:
+                break
+            candidates = min(candidates * 2, total)
+
+        return self._with_distances(latitude, longitude, indices)[:k]
+
+    def nearby_airports(self, airport: str, radius_km: float) -> List[str]:
+        meta = self.airports.get(airport)
+        if meta is None:
+            return [airport]
+
+        nearby = [
+            code
+            for code, _ in self.airports_within(
+                meta["latitude"],
+                meta["longitude"],
+                radius_km,
+                served_only=True,
+            )
+            if code != airport
+        ]
+
+        return [airport, *nearby]
+
     def price_route(self, route: FlightRoute) -> Price:
         base_total = 0.0
         distance_total = 0.0
@@ -159,23 +417,47 @@ class OpenFlightsProvider(FlightDataProvider):
     # Flight Instantiation
     # ---------------------------------------------------------------------
 
+    def _select_templates(
+        self,
+        origin: str,
+        resolved: Optional[_ResolvedFilter],
+    ) -> List[_RouteTemplate]:
+
+        if resolved is None:
+            return self.adjacency[origin]
+
+        allowed, excluded, codeshares = resolved
+
+        by_airline = self.airline_adjacency[origin]
+
+        # Only the matching carriers' sub-lists are touched (sorted so the
+        # returned order is stable for index-based route replay)
+        if allowed is not None:
+            airline_codes = sorted(allowed & by_airline.keys())
+        else:
+            airline_codes = [code for code in by_airline if code not in excluded]
+
+        selected: List[_RouteTemplate] = []
+        for airline_code in airline_codes:
+            templates = by_airline[airline_code]
+            if codeshares:
+                selected.extend(templates)
+            else:
+                selected.extend(t for t in templates if not t.codeshare)
+
+        return selected
+
     def _instantiate_flight(
         self,
         template: _RouteTemplate,
-        requested_departure: datetime,
+        departure_local: datetime,
     ) -> Flight:
 
         origin_meta = self.airports[template.origin]
         dest_meta = self.airports[template.destination]
 
-        origin_tz = origin_meta["timezone"]
         dest_tz = dest_meta["timezone"]
 
-        departure_local = self._next_departure_at_nine(
-            requested_departure,
-            origin_tz,
-        )
-
         distance_km = self._haversine_km(
             origin_meta["latitude"],
             origin_meta["longitude"],
@@ -240,6 +522,35 @@ class OpenFlightsProvider(FlightDataProvider):
 
         return candidate
 
+    def _unit_vector(self, latitude: float, longitude: float) -> np.ndarray:
+        phi = math.radians(latitude)
+        lam = math.radians(longitude)
+        return np.array(
+            (math.cos(phi) * math.cos(lam), math.cos(phi) * math.sin(lam), math.sin(phi))
+        )
+
+    def _with_distances(
+        self,
+        latitude: float,
+        longitude: float,
+        indices: List[int],
+    ) -> List[Tuple[str, float]]:
+
+        results = []
+        for i in indices:
+            code = self._location_codes[i]
+            meta = self.airports[code]
+            distance_km = self._haversine_km(
+                latitude,
+                longitude,
+                meta["latitude"],
+                meta["longitude"],
+            )
+            results.append((code, distance_km))
+
+        results.sort(key=lambda item: item[1])
+        return results
+
     def _resolve_cruise_speed(self, equipment: tuple[str, ...]) -> float:
         for eq in equipment:
             if eq in AIRCRAFT_SPEED_KMH:
@@ -1,8 +1,19 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List
+from typing import (
+    AbstractSet,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
+from entities.airline_filter import AirlineFilter
 from entities.flight import Flight
 from entities.flight_route import FlightRoute
 from entities.price import Price
@@ -18,6 +29,8 @@ def find_flight_routes(
     departure_time: datetime,
     max_legs: int = 3,
     max_routes: int = 10,
+    airline_filter: Optional[AirlineFilter] = None,
+    nearby_radius_km: Optional[float] = None,
 ) -> List[FlightRoute]:
     """
     Iterative Deepening DFS (IDDFS) search.
@@ -25,9 +38,156 @@ def find_flight_routes(
     - Depth (legs) is the primary ordering.
     - Within each depth, routes are sorted by total duration.
     - max_routes is respected globally.
+    - airline_filter restricts carriers inside the provider.
+    - nearby_radius_km widens origin and destination to airports
+      within that distance (see `find_multi_airport_routes`). Airports
+      inside both circles count as destinations; the requested origin
+      and destination always keep their roles.
     """
 
-    final_results: List[FlightRoute] = []
+    return list(
+        iter_flight_routes(
+            origin=origin,
+            destination=destination,
+            provider=provider,
+            departure_time=departure_time,
+            max_legs=max_legs,
+            max_routes=max_routes,
+            airline_filter=airline_filter,
+            nearby_radius_km=nearby_radius_km,
+        )
+    )
+
+
+def iter_flight_routes(
+    *,
+    origin: str,
+    destination: str,
+    provider: FlightDataProvider,
+    departure_time: datetime,
+    max_legs: int = 3,
+    max_routes: int = 10,
+    airline_filter: Optional[AirlineFilter] = None,
+    nearby_radius_km: Optional[float] = None,
+) -> Iterator[FlightRoute]:
+    """
+    Streaming variant of `find_flight_routes`.
+
+    Yields routes in the same order, but each depth is handed to the
+    caller as soon as it has been explored and sorted, so consumers
+    (e.g. the NDJSON exporter) can write results before deeper levels
+    are searched.
+    """
+
+    origins = [origin]
+    destinations = [destination]
+
+    if nearby_radius_km is not None:
+        # The requested airports keep their roles; any other airport in
+        # both circles is treated as a destination only
+        destinations = [
+            airport
+            for airport in provider.nearby_airports(destination, nearby_radius_km)
+            if airport != origin
+        ]
+        origins = [
+            airport
+            for airport in provider.nearby_airports(origin, nearby_radius_km)
+            if airport not in destinations
+        ]
+
+    return _iter_routes(
+        origins=tuple(origins),
+        destinations=frozenset(destinations),
+        provider=provider,
+        departure_time=departure_time,
+        max_legs=max_legs,
+        max_routes=max_routes,
+        airline_filter=airline_filter,
+    )
+
+
+def find_multi_airport_routes(
+    *,
+    origins: Iterable[str],
+    destinations: Iterable[str],
+    provider: FlightDataProvider,
+    departure_time: datetime,
+    max_legs: int = 3,
+    max_routes: int = 10,
+    airline_filter: Optional[AirlineFilter] = None,
+) -> List[FlightRoute]:
+    """
+    Single search between two groups of airports (e.g. a metro area).
+
+    The frontier is seeded with every origin at once and a route
+    terminates at the first destination airport it reaches. Results
+    from all origin/destination pairs share one depth ordering and
+    one max_routes budget, so N x M pair searches collapse into one.
+
+    Routes never pass through another origin airport on the way,
+    unless that airport is also a destination: an airport in both
+    groups can be departed from and arrived at, so overlapping groups
+    never hide routes that end there.
+    """
+
+    return list(
+        iter_multi_airport_routes(
+            origins=origins,
+            destinations=destinations,
+            provider=provider,
+            departure_time=departure_time,
+            max_legs=max_legs,
+            max_routes=max_routes,
+            airline_filter=airline_filter,
+        )
+    )
+
+
+def iter_multi_airport_routes(
+    *,
+    origins: Iterable[str],
+    destinations: Iterable[str],
+    provider: FlightDataProvider,
+    departure_time: datetime,
+    max_legs: int = 3,
+    max_routes: int = 10,
+    airline_filter: Optional[AirlineFilter] = None,
+) -> Iterator[FlightRoute]:
+    """
+    Streaming variant of `find_multi_airport_routes`.
+    """
+
+    return _iter_routes(
+        origins=tuple(dict.fromkeys(origins)),
+        destinations=frozenset(destinations),
+        provider=provider,
+        departure_time=departure_time,
+        max_legs=max_legs,
+        max_routes=max_routes,
+        airline_filter=airline_filter,
+    )
+
+
+def _iter_routes(
+    *,
+    origins: Sequence[str],
+    destinations: AbstractSet[str],
+    provider: FlightDataProvider,
+    departure_time: datetime,
+    max_legs: int,
+    max_routes: int,
+    airline_filter: Optional[AirlineFilter],
+) -> Iterator[FlightRoute]:
+
+    # Origins a route may not pass through (see find_multi_airport_routes)
+    blocked = frozenset(origins) - destinations
+    emitted = 0
+
+    # Outbound flights are shared across origins and depth iterations:
+    # IDDFS re-expands the same states at every depth, and request times
+    # the provider maps to one departure share an entry.
+    outbound_cache: Dict[Tuple[str, Hashable], List[Flight]] = {}
 
     # ------------------------------------------------------------------
     # Iterate depth-first by hop count (IDDFS)
@@ -43,12 +203,11 @@ def find_flight_routes(
             path: List[Flight],
         ) -> None:
 
-            # Stop exploring deeper than current depth limit
-            if len(path) > depth_limit:
-                return
+            # Destination reached; shorter routes were found at earlier depths
+            if path and current_airport in destinations:
 
-            # Destination reached at this depth
-            if path and current_airport == destination:
+                if len(path) < depth_limit:
+                    return
 
                 route = FlightRoute(flights=tuple(path))
                 price: Price = provider.price_route(route)
@@ -61,15 +220,33 @@ def find_flight_routes(
                 depth_results.append(priced_route)
                 return
 
+            # Depth limit reached without arriving; nothing left to expand
+            if len(path) == depth_limit:
+                return
+
             # Continue exploring
-            outbound_flights = provider.get_outbound_flights(
-                origin=current_airport,
-                departure_time=current_time,
+            key = (
+                current_airport,
+                provider.outbound_cache_key(
+                    origin=current_airport,
+                    departure_time=current_time,
+                ),
             )
+            outbound_flights = outbound_cache.get(key)
+            if outbound_flights is None:
+                outbound_flights = provider.get_outbound_flights(
+                    origin=current_airport,
+                    departure_time=current_time,
+                    airline_filter=airline_filter,
+                )
+                outbound_cache[key] = outbound_flights
 
             for flight in outbound_flights:
 
-                # Avoid cycles
+                # Avoid cycles (and detours through other origins)
+                if flight.destination in blocked:
+                    continue
+
                 visited_airports = {f.origin for f in path}
                 if flight.destination in visited_airports:
                     continue
@@ -89,12 +266,13 @@ def find_flight_routes(
                     path=path + [flight],
                 )
 
-        # Run DFS for this depth
-        dfs(
-            current_airport=origin,
-            current_time=departure_time,
-            path=[],
-        )
+        # Run DFS for this depth, seeded from every origin
+        for origin in origins:
+            dfs(
+                current_airport=origin,
+                current_time=departure_time,
+                path=[],
+            )
 
         # --------------------------------------------------------------
         # Sort ONCE per depth by total trip time
@@ -102,14 +280,13 @@ def find_flight_routes(
 
         depth_results.sort(key=lambda r: r.total_trip_time)
 
-        # Add best from this depth to final results
+        # Emit best from this depth
         for route in depth_results:
-            if len(final_results) >= max_routes:
-                return final_results
-            final_results.append(route)
+            if emitted >= max_routes:
+                return
+            emitted += 1
+            yield route
 
         # If we already have enough routes, stop deepening
-        if len(final_results) >= max_routes:
+        if emitted >= max_routes:
             break
-
-    return final_results
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from entities.airline_filter import AirlineFilter
+from entities.flight import Flight
+from entities.flight_route import FlightRoute
+from providers.base import FlightDataProvider
+from search.constraints import is_connection_time_valid
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_us(moment: datetime) -> int:
+    return (moment.astimezone(timezone.utc) - _EPOCH) // timedelta(microseconds=1)
+
+
+class Isochrone:
+    """
+    Result of a one-to-all earliest-arrival query.
+
+    Labels are stored column-wise in numpy arrays (airport index,
+    arrival in UTC epoch microseconds, leg count, predecessor label,
+    flight index), and `best_label` maps each reached airport to its
+    earliest-arrival label. Flights are not kept: `route_to` rebuilds a
+    FlightRoute on demand by replaying the predecessor chain through
+    the provider.
+    """
+
+    def __init__(
+        self,
+        *,
+        origin: str,
+        departure_time: datetime,
+        provider: FlightDataProvider,
+        airline_filter: Optional[AirlineFilter],
+        airports: List[str],
+        best_label: np.ndarray,
+        label_airport: np.ndarray,
+        label_arrival: np.ndarray,
+        label_legs: np.ndarray,
+        label_parent: np.ndarray,
+        label_flight: np.ndarray,
+    ) -> None:
+        self.origin = origin
+        self.departure_time = departure_time
+        self.provider = provider
+        self.airline_filter = airline_filter
+
+        # Per reached airport: its code and earliest-arrival label
+        self.airports = airports
+        self.best_label = best_label
+        self._index = {code: i for i, code in enumerate(airports)}
+
+        self.label_airport = label_airport
+        self.label_arrival = label_arrival
+        self.label_legs = label_legs
+        self.label_parent = label_parent
+        self.label_flight = label_flight
+
+    def __len__(self) -> int:
+        return len(self.airports)
+
+    def __contains__(self, airport: str) -> bool:
+        return airport in self._index
+
+    def reachable(self) -> List[str]:
+        """
+        Reachable airports (excluding the origin), earliest arrival first.
+        """
+        order = np.argsort(self.label_arrival[self.best_label], kind="stable")
+        return [self.airports[i] for i in order]
+
+    def earliest_arrival(self, airport: str) -> datetime:
+        arrival_us = int(self.label_arrival[self._best(airport)])
+        return _EPOCH + timedelta(microseconds=arrival_us)
+
+    def legs(self, airport: str) -> int:
+        return int(self.label_legs[self._best(airport)])
+
+    def predecessors(self, airport: str) -> Tuple[str, ...]:
+        """
+        Airports on the earliest-arrival path, origin first.
+        """
+        chain = [
+            self.airports[self.label_airport[label]]
+            for label in self._label_chain(self._best(airport))
+        ]
+        return (self.origin, *chain)
+
+    def route_to(self, airport: str) -> FlightRoute:
+        flights: List[Flight] = []
+
+        current_airport = self.origin
+        current_time = self.departure_time
+
+        for label in self._label_chain(self._best(airport)):
+            outbound = self.provider.get_outbound_flights(
+                origin=current_airport,
+                departure_time=current_time,
+                airline_filter=self.airline_filter,
+            )
+            flight = outbound[self.label_flight[label]]
+            flights.append(flight)
+
+            current_airport = flight.destination
+            current_time = flight.arrival_time
+
+        route = FlightRoute(flights=tuple(flights))
+        return FlightRoute(flights=route.flights, price=self.provider.price_route(route))
+
+    def _best(self, airport: str) -> int:
+        return int(self.best_label[self._index[airport]])
+
+    def _label_chain(self, label: int) -> List[int]:
+        chain = []
+        while label >= 0:
+            chain.append(label)
+            label = int(self.label_parent[label])
+        chain.reverse()
+        return chain
+
+
+def find_reachable_airports(
+    *,
+    origin: str,
+    provider: FlightDataProvider,
+    departure_time: datetime,
+    max_legs: int = 3,
+    max_duration: Optional[timedelta] = None,
+    airline_filter: Optional[AirlineFilter] = None,
+) -> Isochrone:
+    """
+    One-to-all earliest-arrival search.
+
+    A single round-based expansion from `origin`: round k extends the
+    labels that survived round k - 1 by one leg. The same connection
+    rules as `find_flight_routes` apply, which makes arrival time
+    alone an unsafe dominance criterion (an earlier arrival can miss
+    the maximum connection window). A label is therefore only pruned
+    when another label at the same airport, with no more legs and no
+    later arrival, opens exactly the same onward departures.
+
+    `max_duration` bounds arrival relative to `departure_time`.
+    """
+
+    deadline = (
+        departure_time.astimezone() + max_duration
+        if max_duration is not None
+        else None
+    )
+
+    airport_index: Dict[str, int] = {}
+    airports: List[str] = []
+
+    label_airport: List[int] = []
+    label_arrival: List[int] = []
+    label_legs: List[int] = []
+    label_parent: List[int] = []
+    label_flight: List[int] = []
+
+    best: List[int] = []
+
+    # (airport, onward departure signature) -> arrival of the dominating label
+    dominance: Dict[Tuple[str, Tuple[datetime, ...]], int] = {}
+
+    # Frontier entries: (label, valid onward flights as (index, flight))
+    frontier: List[Tuple[int, List[Tuple[int, Flight]]]] = [
+        (
+            -1,
+            list(
+                enumerate(
+                    provider.get_outbound_flights(
+                        origin=origin,
+                        departure_time=departure_time,
+                        airline_filter=airline_filter,
+                    )
+                )
+            ),
+        )
+    ]
+
+    def visited(label: int) -> set[str]:
+        airports_on_path = {origin}
+        while label >= 0:
+            airports_on_path.add(airports[label_airport[label]])
+            label = label_parent[label]
+        return airports_on_path
+
+    for legs in range(1, max_legs + 1):
+
+        next_frontier = []
+        seen_arrivals: set[Tuple[str, datetime]] = set()
+
+        for parent, onward in frontier:
+
+            on_path = visited(parent)
+
+            for flight_index, flight in onward:
+
+                destination = flight.destination
+                arrival = flight.arrival_time
+
+                if destination in on_path:
+                    continue
+
+                if deadline is not None and arrival > deadline:
+                    continue
+
+                if (destination, arrival) in seen_arrivals:
+                    continue
+                seen_arrivals.add((destination, arrival))
+
+                arrival_us = _to_us(arrival)
+
+                index = airport_index.get(destination)
+                improves = index is None or arrival_us < label_arrival[best[index]]
+
+                # Onward flights that satisfy the connection rules
+                valid: List[Tuple[int, Flight]] = []
+                if legs < max_legs:
+                    valid = [
+                        (i, candidate)
+                        for i, candidate in enumerate(
+                            provider.get_outbound_flights(
+                                origin=destination,
+                                departure_time=arrival,
+                                airline_filter=airline_filter,
+                            )
+                        )
+                        if is_connection_time_valid(
+                            previous_arrival=arrival,
+                            next_departure=candidate.departure_time,
+                        )
+                    ]
+
+                expands = False
+                if valid:
+                    signature = (
+                        destination,
+                        tuple(sorted({f.departure_time for _, f in valid})),
+                    )
+                    incumbent = dominance.get(signature)
+                    if incumbent is None or arrival_us < incumbent:
+                        dominance[signature] = arrival_us
+                        expands = True
+
+                if not improves and not expands:
+                    continue
+
+                # Record label
+                if index is None:
+                    index = len(airports)
+                    airport_index[destination] = index
+                    airports.append(destination)
+                    best.append(-1)
+
+                label = len(label_airport)
+                label_airport.append(index)
+                label_arrival.append(arrival_us)
+                label_legs.append(legs)
+                label_parent.append(parent)
+                label_flight.append(flight_index)
+
+                if improves:
+                    best[index] = label
+
+                if expands:
+                    next_frontier.append((label, valid))
+
+        frontier = next_frontier
+        if not frontier:
+            break
+
+    return Isochrone(
+        origin=origin,
+        departure_time=departure_time,
+        provider=provider,
+        airline_filter=airline_filter,
+        airports=airports,
+        best_label=np.array(best, dtype=np.int32),
+        label_airport=np.array(label_airport, dtype=np.int32),
+        label_arrival=np.array(label_arrival, dtype=np.int64),
+        label_legs=np.array(label_legs, dtype=np.int8),
+        label_parent=np.array(label_parent, dtype=np.int32),
+        label_flight=np.array(label_flight, dtype=np.int16),
+    )
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from entities.airline_filter import AirlineFilter
+from entities.flight import Flight
+from entities.flight_route import FlightRoute
+from providers.base import FlightDataProvider
+from search.constraints import is_connection_time_valid
+
+
+# A label is the last flight of a partial itinerary plus its parent label
+_Label = Tuple[Flight, Optional[tuple]]
+
+# (airport, request time) -> outbound flights, memoised for one profile query
+_Outbound = Callable[[str, datetime], List[Flight]]
+
+
+def find_profile_routes(
+    *,
+    origin: str,
+    destination: str,
+    provider: FlightDataProvider,
+    window_start: datetime,
+    window_end: datetime,
+    max_legs: int = 3,
+    airline_filter: Optional[AirlineFilter] = None,
+) -> List[FlightRoute]:
+    """
+    Departure-window profile search.
+
+    Returns the Pareto set of itineraries for every search time in
+    [window_start, window_end]: no returned route is beaten by another
+    that departs no earlier and arrives no later. Routes are ordered
+    by departure.
+
+    Distinct first-leg departures are scanned latest to earliest and
+    labels are shared between runs, so an earlier run only explores
+    where it can still beat what later departures already achieve.
+    Outbound flights are memoised for the duration of the query under
+    the provider's `outbound_cache_key`, so the many arrival times that
+    map to the same departure only instantiate flights once.
+    """
+
+    window_start = window_start.astimezone()
+    window_end = window_end.astimezone()
+
+    outbound_cache: Dict[Tuple[str, Hashable], List[Flight]] = {}
+
+    def outbound(airport: str, request_time: datetime) -> List[Flight]:
+        key = (
+            airport,
+            provider.outbound_cache_key(origin=airport, departure_time=request_time),
+        )
+        flights = outbound_cache.get(key)
+        if flights is None:
+            flights = provider.get_outbound_flights(
+                origin=airport,
+                departure_time=request_time,
+                airline_filter=airline_filter,
+            )
+            outbound_cache[key] = flights
+        return flights
+
+    departures = _departure_times(
+        origin=origin,
+        outbound=outbound,
+        window_start=window_start,
+        window_end=window_end,
+    )
+
+    # (airport, onward departure signature) -> {legs: earliest arrival}
+    dominance: Dict[Tuple[str, Tuple[datetime, ...]], Dict[int, datetime]] = {}
+
+    best_arrival: Optional[datetime] = None
+    profile: List[FlightRoute] = []
+
+    for departure in reversed(departures):
+
+        label = _earliest_arrival_run(
+            origin=origin,
+            destination=destination,
+            outbound=outbound,
+            departure=departure,
+            max_legs=max_legs,
+            bound=best_arrival,
+            dominance=dominance,
+        )
+
+        if label is None:
+            continue
+
+        flights: List[Flight] = []
+        while label is not None:
+            flights.append(label[0])
+            label = label[1]
+        flights.reverse()
+
+        route = FlightRoute(flights=tuple(flights))
+        profile.append(
+            FlightRoute(flights=route.flights, price=provider.price_route(route))
+        )
+        best_arrival = route.arrival_time
+
+    profile.reverse()
+    return profile
+
+
+def _departure_times(
+    *,
+    origin: str,
+    outbound: _Outbound,
+    window_start: datetime,
+    window_end: datetime,
+) -> List[datetime]:
+    """
+    Distinct first-leg departure times reachable from a search time
+    inside the window (including the one a late search rolls over to).
+    """
+
+    departures: set[datetime] = set()
+    search_time = window_start
+
+    while search_time <= window_end:
+        flights = outbound(origin, search_time)
+        if not flights:
+            break
+
+        times = {flight.departure_time for flight in flights}
+        departures.update(times)
+
+        # Every search time before the next departure maps to the same flights
+        search_time = min(times) + timedelta(microseconds=1)
+
+    return sorted(departures)
+
+
+def _earliest_arrival_run(
+    *,
+    origin: str,
+    destination: str,
+    outbound: _Outbound,
+    departure: datetime,
+    max_legs: int,
+    bound: Optional[datetime],
+    dominance: Dict[Tuple[str, Tuple[datetime, ...]], Dict[int, datetime]],
+) -> Optional[_Label]:
+    """
+    Earliest arrival at `destination` for a fixed first departure.
+
+    Labels arriving no earlier than `bound` (the best arrival of a
+    later departure) are pruned, as are labels dominated in
+    `dominance` by a label with no more legs and no later arrival
+    that opens the same onward departures.
+    """
+
+    first_legs = [
+        flight
+        for flight in outbound(origin, departure - timedelta(microseconds=1))
+        if flight.departure_time == departure
+    ]
+
+    best: Optional[_Label] = None
+    frontier: List[Tuple[Optional[_Label], List[Flight]]] = [(None, first_legs)]
+
+    for legs in range(1, max_legs + 1):
+
+        next_frontier = []
+
+        for parent, onward in frontier:
+
+            on_path = {origin}
+            label = parent
+            while label is not None:
+                on_path.add(label[0].destination)
+                label = label[1]
+
+            for flight in onward:
+
+                arrival = flight.arrival_time
+
+                if flight.destination in on_path:
+                    continue
+
+                if bound is not None and arrival >= bound:
+                    continue
+
+                label = (flight, parent)
+
+                # Destination reached; tighten the bound for this run
+                if flight.destination == destination:
+                    best = label
+                    bound = arrival
+                    continue
+
+                if legs == max_legs:
+                    continue
+
+                valid = [
+                    candidate
+                    for candidate in outbound(flight.destination, arrival)
+                    if is_connection_time_valid(
+                        previous_arrival=arrival,
+                        next_departure=candidate.departure_time,
+                    )
+                ]
+
+                if not valid:
+                    continue
+
+                signature = (
+                    flight.destination,
+                    tuple(sorted({candidate.departure_time for candidate in valid})),
+                )
+                incumbents = dominance.setdefault(signature, {})
+
+                if any(
+                    incumbent_legs <= legs and incumbent_arrival <= arrival
+                    for incumbent_legs, incumbent_arrival in incumbents.items()
+                ):
+                    continue
+
+                incumbents[legs] = arrival
+                next_frontier.append((label, valid))
+
+        frontier = next_frontier
+        if not frontier:
+            break
+
+    return best